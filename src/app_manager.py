@@ -1,10 +1,13 @@
 import os
 import logging
 import queue
-import threading
+from logging.handlers import QueueHandler, QueueListener
 from typing import List
 from config_loader import ConfigLoader
-from worker import ImageWorker
+from worker import ImageWorker, make_processor
+
+# Supported image extensions (lowercase, used with str.endswith).
+VALID_EXTENSIONS = ('.jpg', '.jpeg', '.png', '.bmp')
 
 
 class BatchProcessorApp:
@@ -25,11 +28,13 @@ class BatchProcessorApp:
         self._resolve_paths()
 
         # Setup Logging
+        self.log_listener = None
         self._setup_logging()
 
         # Synchronization primitives
-        self.task_queue = queue.Queue()
-        self.stop_event = threading.Event()
+        # SimpleQueue is implemented in C and avoids the Condition-based
+        # locking of queue.Queue on every put/get.
+        self.task_queue = queue.SimpleQueue()
         self.threads: List[ImageWorker] = []
 
     def _resolve_paths(self):
@@ -38,17 +43,44 @@ class BatchProcessorApp:
             self.config[key] = os.path.join(self.base_dir, self.config[key])
 
     def _setup_logging(self):
-        """Initializes logging configuration."""
+        """
+        Initializes logging configuration.
+        All threads only put records on a queue; a single listener thread
+        formats them and writes them to the log file and console.
+        """
+        root = logging.getLogger()
+
+        # Configure only once; creating the app again must not add duplicate handlers.
+        if root.handlers:
+            return
+
         os.makedirs(os.path.dirname(self.config['log_file']), exist_ok=True)
-        logging.basicConfig(
-            filename=self.config['log_file'],
-            level=logging.INFO,
-            format='%(asctime)s - [%(threadName)s] - %(levelname)s - %(message)s',
+        file_handler = logging.FileHandler(self.config['log_file'])
+        file_handler.setFormatter(logging.Formatter(
+            '%(asctime)s - [%(threadName)s] - %(levelname)s - %(message)s',
             datefmt='%H:%M:%S'
-        )
+        ))
         console = logging.StreamHandler()
         console.setLevel(logging.INFO)
-        logging.getLogger('').addHandler(console)
+
+        log_queue = queue.SimpleQueue()
+        self.log_handler = QueueHandler(log_queue)
+        root.setLevel(logging.INFO)
+        root.addHandler(self.log_handler)
+
+        self.log_listener = QueueListener(log_queue, file_handler, console)
+        self.log_listener.start()
+
+    def _shutdown_logging(self):
+        """Writes out all queued log records and detaches the queue handler."""
+        if self.log_listener is None:
+            return
+
+        self.log_listener.stop()  # Drains the queue before returning
+        logging.getLogger().removeHandler(self.log_handler)
+        for handler in self.log_listener.handlers:
+            handler.close()
+        self.log_listener = None
 
     def run(self):
         """
@@ -56,19 +88,23 @@ class BatchProcessorApp:
         """
         logging.info("--- Application Starting ---")
 
-        # Ensure output dir exists
-        os.makedirs(self.config['destination_folder'], exist_ok=True)
+        try:
+            # Ensure output dir exists
+            os.makedirs(self.config['destination_folder'], exist_ok=True)
 
-        # 1. Start Consumers (Workers)
-        self._start_workers()
+            # 1. Start Consumers (Workers)
+            self._start_workers()
 
-        # 2. Run Producer (Main Thread)
-        self._produce_tasks()
+            # 2. Run Producer (Main Thread)
+            self._produce_tasks()
 
-        # 3. Wait for completion
-        self._wait_for_completion()
+            # 3. Wait for completion
+            self._wait_for_completion()
 
-        logging.info("--- Application Finished ---")
+            logging.info("--- Application Finished ---")
+        finally:
+            # 4. Flush pending log records
+            self._shutdown_logging()
 
     def _start_workers(self):
         """
@@ -90,8 +126,11 @@ class BatchProcessorApp:
 
         logging.info(f"Spawning {count} worker threads...")
 
+        # Resize settings are fixed for the run; build the processing function once.
+        processor = make_processor(self.config['resize_width'], self.config['resize_height'])
+
         for i in range(count):
-            worker = ImageWorker(i + 1, self.task_queue, self.config, self.stop_event)
+            worker = ImageWorker(i + 1, self.task_queue, processor)
             worker.start()
             self.threads.append(worker)
 
@@ -99,22 +138,29 @@ class BatchProcessorApp:
         """
         Scans the input folder, validates files, and fills the queue.
         This represents the PRODUCER logic.
+        Tasks are queued while the folder is still being scanned, so the
+        already running workers start processing right after the first entry.
         """
         src = self.config['source_folder']
+        # Output paths are built here once, so workers do not have to join paths per task.
+        dest_prefix = os.path.join(self.config['destination_folder'], '')
         logging.info(f"Producer: Scanning folder: {src}")
 
         added_count = 0
         skipped_count = 0
 
         try:
-            # Iterate over all entries in the directory
-            for entry in os.listdir(src):
-                if self._validate_input_file(entry):
-                    self.task_queue.put(entry)
-                    added_count += 1
-                else:
-                    skipped_count += 1
-                    logging.warning(f"Producer: Skipped invalid file: {entry}")
+            # Iterate over all entries in the directory.
+            # os.scandir caches file type and size on the DirEntry,
+            # which saves separate stat() calls for every file.
+            with os.scandir(src) as it:
+                for entry in it:
+                    if self._validate_input_file(entry):
+                        self.task_queue.put((entry.path, dest_prefix + entry.name))
+                        added_count += 1
+                    else:
+                        skipped_count += 1
+                        logging.warning(f"Producer: Skipped invalid file: {entry.name}")
 
             logging.info(f"Producer finished: {added_count} tasks added, {skipped_count} skipped.")
 
@@ -123,7 +169,7 @@ class BatchProcessorApp:
         except PermissionError:
             logging.error(f"Permission denied accessing folder: {src}")
 
-    def _validate_input_file(self, file_name: str) -> bool:
+    def _validate_input_file(self, entry: os.DirEntry) -> bool:
         """
         Validates if the file is suitable for processing.
 
@@ -133,34 +179,34 @@ class BatchProcessorApp:
         3. Must not be empty (size > 0 bytes).
 
         Args:
-            file_name (str): Name of the file to check.
+            entry (os.DirEntry): Directory entry of the file to check.
 
         Returns:
             bool: True if valid, False otherwise.
         """
-        full_path = os.path.join(self.config['source_folder'], file_name)
-
         # Check 1: Is it a file?
-        if not os.path.isfile(full_path):
+        if not entry.is_file():
             return False
 
         # Check 2: Valid extension?
-        valid_extensions = ('.jpg', '.jpeg', '.png', '.bmp')
-        if not file_name.lower().endswith(valid_extensions):
+        if not entry.name.lower().endswith(VALID_EXTENSIONS):
             return False
 
         # Check 3: Is file empty? (Zero bytes files cause crashes)
-        if os.path.getsize(full_path) == 0:
+        if entry.stat().st_size == 0:
             return False
 
         return True
 
     def _wait_for_completion(self):
-        """Waits for the queue to empty and stops threads."""
-        self.task_queue.join()  # Block until queue is empty
-        logging.info("All tasks in queue processed. Stopping threads...")
+        """Signals threads to stop and waits until they drain the queue."""
+        logging.info("All tasks queued. Waiting for threads to finish...")
 
-        self.stop_event.set()  # Signal threads to stop
+        # Producer is done; one stop sentinel per worker, queued after all tasks.
+        for _ in self.threads:
+            self.task_queue.put(None)
 
         for t in self.threads:
-            t.join()  # Wait for threads to close
\ No newline at end of file
+            t.join()  # Wait for threads to close
+
+        logging.info("All tasks in queue processed.")
\ No newline at end of file
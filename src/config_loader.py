@@ -1,5 +1,4 @@
 import json
-import os
 from typing import Dict, Any
 
 class ConfigLoader:
@@ -20,11 +19,11 @@ class ConfigLoader:
             FileNotFoundError: If the file does not exist.
             ValueError: If the JSON is invalid.
         """
-        if not os.path.exists(self.config_path):
-            raise FileNotFoundError(f"Configuration file not found at: {self.config_path}")
-
+        # No separate os.path.exists() check; open() reports a missing file itself.
         try:
             with open(self.config_path, 'r') as f:
                 return json.load(f)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Configuration file not found at: {self.config_path}")
         except json.JSONDecodeError as e:
             raise ValueError(f"Failed to parse JSON config: {e}")
\ No newline at end of file
@@ -1,9 +1,49 @@
 import threading
 import queue
 import os
+import shutil
 import logging
+from typing import Callable
 from PIL import Image
 
+logger = logging.getLogger(__name__)
+
+
+def make_processor(width: int, height: int) -> Callable[[str, str], None]:
+    """
+    Builds the image processing function for a fixed target size.
+    The size is baked into the closure, so no config lookups happen per task.
+
+    Args:
+        width (int): Target width in pixels.
+        height (int): Target height in pixels.
+
+    Returns:
+        Callable[[str, str], None]: Function taking (input_path, output_path).
+    """
+    size = (width, height)
+    draft_size = (width * 2, height * 2)
+    resample = Image.Resampling.BILINEAR
+
+    def process(input_path: str, output_path: str):
+        with Image.open(input_path) as img:
+            if img.width <= width and img.height <= height:
+                # Image already fits into the target size, no resize needed.
+                # Only the header has been read so far; copy the file as-is
+                # (kernel-side copy, no decode/encode, no recompression).
+                shutil.copyfile(input_path, output_path)
+            else:
+                # Let the JPEG decoder scale down via DCT (1/2, 1/4, 1/8) while decoding.
+                # Keeps at least twice the target size for quality; no-op for other formats.
+                img.draft(img.mode, draft_size)
+                # Explicit BILINEAR filter: cheaper than the default BICUBIC and
+                # uses the SIMD kernels when Pillow-SIMD is installed.
+                img_resized = img.resize(size, resample)
+                # Save the result to the output directory
+                img_resized.save(output_path)
+
+    return process
+
 
 class ImageWorker(threading.Thread):
     """
@@ -11,69 +51,52 @@ class ImageWorker(threading.Thread):
     Inherits from threading.Thread for OOP structure.
     """
 
-    def __init__(self, thread_id: int, task_queue: queue.Queue, config: dict, stop_event: threading.Event):
+    def __init__(self, thread_id: int, task_queue: queue.SimpleQueue, processor: Callable[[str, str], None]):
         """
         Initializes the worker thread.
 
         Args:
             thread_id (int): Unique identifier for the worker.
-            task_queue (queue.Queue): Shared queue to pull tasks from.
-            config (dict): Application configuration settings.
-            stop_event (threading.Event): Event to signal thread termination.
+            task_queue (queue.SimpleQueue): Shared queue to pull tasks from.
+            processor (Callable[[str, str], None]): Function from make_processor() doing the actual work.
         """
         super().__init__()
         self.thread_id = thread_id
         self.task_queue = task_queue
-        self.config = config
-        self.stop_event = stop_event
+        self.processor = processor
         self.name = f"Worker-{thread_id}"
 
     def run(self):
         """
         Main execution loop of the thread.
-        Continuously pulls tasks from the queue until the stop signal is set.
+        Continuously pulls tasks from the queue until the stop sentinel (None) is received.
         """
-        logging.info(f"{self.name} started.")
-
-        while not self.stop_event.is_set() or not self.task_queue.empty():
-            try:
-                # 1. Attempt to retrieve a task from the queue with a timeout.
-                # The timeout prevents blocking indefinitely if the producer stops.
-                file_name = self.task_queue.get(timeout=1)
-            except queue.Empty:
-                # 2. Critical: If the queue is empty, restart the loop to check the stop_event.
-                # Do NOT call task_done() here as no task was retrieved.
-                continue
-
-            # 3. Process the retrieved image.
-            self.process_image(file_name)
-
-            # 4. Signal that the task is complete.
-            # This is only called if step 1 succeeded.
-            self.task_queue.task_done()
-
-    def process_image(self, file_name: str):
+        logger.info(f"{self.name} started.")
+
+        process_image = self.process_image
+
+        # Block on get() until a task is available (no timeout, no polling);
+        # iteration stops at the None sentinel pushed after the last task.
+        for input_path, output_path in iter(self.task_queue.get, None):
+            process_image(input_path, output_path)
+
+    def process_image(self, input_path: str, output_path: str):
         """
-        Handles the logic for resizing and saving the image.
+        Runs the processor on one image and logs the result.
 
         Args:
-            file_name (str): The name of the file to process.
+            input_path (str): Full path of the file to process.
+            output_path (str): Full path where the result is saved.
         """
-        input_path = os.path.join(self.config['source_folder'], file_name)
-        output_path = os.path.join(self.config['destination_folder'], file_name)
+        file_name = os.path.basename(input_path)
 
         try:
-            logging.info(f"{self.name}: Processing {file_name}")
+            logger.info(f"{self.name}: Processing {file_name}")
 
-            with Image.open(input_path) as img:
-                # Resize logic based on configuration
-                new_size = (self.config['resize_width'], self.config['resize_height'])
-                img_resized = img.resize(new_size)
-                # Save the result to the output directory
-                img_resized.save(output_path)
+            self.processor(input_path, output_path)
 
-            logging.info(f"{self.name}: Finished {file_name}")
+            logger.info(f"{self.name}: Finished {file_name}")
 
         except Exception as e:
             # Catch all exceptions to prevent the thread from crashing
-            logging.error(f"{self.name}: Error processing {file_name}: {e}")
\ No newline at end of file
+            logger.error(f"{self.name}: Error processing {file_name}: {e}")
\ No newline at end of file
@@ -22,21 +22,27 @@ class TestConfigLoader(unittest.TestCase):
         })
 
 
-        with patch("os.path.exists", return_value=True):
-            with patch("builtins.open", mock_open(read_data=mock_data)):
-                loader = ConfigLoader("fake_path.json")
-                config = loader.load_config()
+        with patch("builtins.open", mock_open(read_data=mock_data)):
+            loader = ConfigLoader("fake_path.json")
+            config = loader.load_config()
 
-                self.assertEqual(config["number_of_threads"], 4)
-                self.assertEqual(config["source_folder"], "data/input")
+            self.assertEqual(config["number_of_threads"], 4)
+            self.assertEqual(config["source_folder"], "data/input")
 
     def test_file_not_found(self):
         """Test if FileNotFoundError is raised when file is missing."""
-        with patch("os.path.exists", return_value=False):
+        with patch("builtins.open", side_effect=FileNotFoundError):
             loader = ConfigLoader("non_existent.json")
             with self.assertRaises(FileNotFoundError):
                 loader.load_config()
 
+    def test_invalid_json(self):
+        """Test if ValueError is raised when JSON cannot be parsed."""
+        with patch("builtins.open", mock_open(read_data="{not valid json")):
+            loader = ConfigLoader("broken.json")
+            with self.assertRaises(ValueError):
+                loader.load_config()
+
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file